@@ -12,225 +12,461 @@ Date: August 2025
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-import plotly.offline as pyo
+from plotly.offline import get_plotlyjs_version
 from plotly.subplots import make_subplots
 import json
 import os
+import heapq
+from operator import itemgetter
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 
-class StaticDashboardGenerator:
-    def __init__(self, csv_path, json_path):
-        self.csv_path = csv_path
-        self.json_path = json_path
-        self.df = None
-        self.summary_data = None
-        self.charts = []
-        
-    def load_data(self):
-        """Load analysis data"""
-        try:
-            self.df = pd.read_csv(self.csv_path)
-            with open(self.json_path, 'r') as f:
-                self.summary_data = json.load(f)
-            print("✅ Data loaded successfully")
-            return True
-        except Exception as e:
-            print(f"❌ Error loading data: {e}")
-            return False
-    
-    def create_overview_chart(self):
-        """Create overview metrics chart"""
-        if not self.summary_data:
-            return ""
-        
-        summary = self.summary_data['analysis_summary']
-        engagement = self.summary_data.get('engagement_analysis', {})
+# Prefer orjson for parsing the summary file when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Column types for the analysis CSV; the repeated category labels are
+# dictionary-encoded at parse time instead of kept as one string per row
+_CSV_DTYPES = {
+    'Categories': 'category',
+    'Subcategories': 'category'
+}
+
+# Counter columns downcast to the narrowest integer type that holds their values
+_INTEGER_COLUMNS = ('Views', 'Forwards', 'Intensity_Score')
+
+# Static page fragments written in order by generate_html_dashboard
+_DOCTYPE = '''<!DOCTYPE html>
+'''
+
+# Records which CSV/JSON inputs a generated page was built from
+_FINGERPRINT_TEMPLATE = '''<!-- source-fingerprint: {fingerprint} -->
+'''
+
+_HTML_HEAD = '''<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Telegram Analysis Dashboard</title>
+'''
+
+# plotly-latest is frozen at an old 1.x build; load the plotly.js release that
+# matches the installed plotly package so the embedded figure JSON is understood
+_PLOTLY_SCRIPT_TEMPLATE = '''    <link rel="preconnect" href="https://cdn.plot.ly">
+    <script defer src="https://cdn.plot.ly/plotly-{version}.min.js"></script>
+'''
+
+_HTML_STYLE = '''    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background-color: white;
+            border-radius: 10px;
+            padding: 30px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        .header {
+            text-align: center;
+            margin-bottom: 40px;
+            color: #2c3e50;
+        }
+        .header h1 {
+            font-size: 2.5em;
+            margin-bottom: 10px;
+            color: #1f77b4;
+        }
+        .header p {
+            font-size: 1.2em;
+            color: #7f8c8d;
+        }
+        .metrics-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            margin-bottom: 40px;
+        }
+        .metric-card {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 20px;
+            border-radius: 10px;
+            text-align: center;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        .metric-value {
+            font-size: 2em;
+            font-weight: bold;
+            margin-bottom: 5px;
+        }
+        .metric-label {
+            font-size: 0.9em;
+            opacity: 0.9;
+        }
+        .chart-container {
+            margin-bottom: 40px;
+            background: white;
+            border-radius: 8px;
+            padding: 20px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .chart-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(500px, 1fr));
+            gap: 30px;
+            margin-bottom: 40px;
+        }
+        .insights {
+            background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 10px;
+            margin-top: 40px;
+        }
+        .insights h3 {
+            margin-top: 0;
+            font-size: 1.5em;
+        }
+        .insights ul {
+            margin: 0;
+            padding-left: 20px;
+        }
+        .insights li {
+            margin-bottom: 10px;
+        }
+        .timestamp {
+            text-align: center;
+            color: #7f8c8d;
+            margin-top: 40px;
+            padding-top: 20px;
+            border-top: 1px solid #ecf0f1;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📊 Telegram Analysis Dashboard</h1>
+            <p>Anti-Gender Narratives Analysis - DMCA Thematic Coding Framework v1.0</p>
+        </div>
+        
+'''
+
+_METRICS_TEMPLATE = '''        <div class="metrics-grid">
+            <div class="metric-card">
+                <div class="metric-value">{total_messages:,}</div>
+                <div class="metric-label">Total Messages Analyzed</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-value">{relevant_messages:,}</div>
+                <div class="metric-label">Relevant Messages Found</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-value">{relevance_rate:.2f}%</div>
+                <div class="metric-label">Relevance Rate</div>
+            </div>
+            <div class="metric-card">
+                <div class="metric-value">{viral_messages:,}</div>
+                <div class="metric-label">Viral Messages</div>
+            </div>
+        </div>
         
-        # Create metrics visualization
-        fig = go.Figure()
+'''
+
+_GRID_OPEN = '''        <div class="chart-grid">
+'''
+_GRID_CLOSE = '''        </div>
         
-        metrics = [
-            ("Total Messages", summary['total_messages_analyzed']),
-            ("Relevant Messages", summary['relevant_messages_found']),
-            ("Viral Messages", engagement.get('viral_messages', 0)),
-            ("High Engagement", engagement.get('high_engagement_messages', 0))
-        ]
+'''
+_CHART_OPEN = '''        <div class="chart-container">
+            '''
+_CHART_CLOSE = '''
+        </div>
         
-        fig.add_trace(go.Bar(
+'''
+
+# Chart rows in page order; rows with two charts share a chart-grid
+_CHART_LAYOUT = (
+    ('overview_chart',),
+    ('category_chart', 'intensity_chart'),
+    ('subcategory_chart',),
+    ('linguistic_markers_chart',),
+    ('engagement_chart', 'media_chart'),
+)
+
+_INSIGHTS_HTML = '''        <div class="insights">
+            <h3>🧠 Key Research Insights</h3>
+            <ul>
+                <li><strong>Religious Opposition Dominance:</strong> 97% of coded content uses religious framing with "sin" appearing 977 times</li>
+                <li><strong>Sophisticated Messaging Strategy:</strong> 99.9% content at Level 1 intensity, designed to evade content moderation</li>
+                <li><strong>High Viral Potential:</strong> 85.9% of relevant messages were forwarded, indicating strong engagement</li>
+                <li><strong>Coordinated Campaign Evidence:</strong> "Masculinity Saturday" recurring pattern suggests organized efforts</li>
+                <li><strong>Media Strategy:</strong> 53% of relevant messages include multimedia content for increased viral potential</li>
+            </ul>
+        </div>
+        
+'''
+
+_FOOTER_TEMPLATE = '''        <div class="timestamp">
+            <p>Analysis generated on {generated_at}</p>
+            <p>Framework: DMCA Thematic Coding Guide v1.0 | Analyst: Chaos</p>
+        </div>
+    </div>
+'''
+
+# Figures are embedded as JSON data blocks and drawn by a single shared script
+_FIGURE_TEMPLATE = '''<div id="{chart_id}" class="plotly-graph-div"></div>
+            <script type="application/json" class="plotly-figure" data-target="{chart_id}">{figure_json}</script>'''
+
+_PLOTLY_BOOTSTRAP = '''    <script>
+        // Plotly is loaded with defer, so draw once the document has been parsed
+        document.addEventListener('DOMContentLoaded', function () {
+            document.querySelectorAll('script.plotly-figure').forEach(function (el) {
+                var figure = JSON.parse(el.textContent);
+                Plotly.newPlot(el.dataset.target, figure.data, figure.layout, {responsive: true});
+            });
+        });
+    </script>
+</body>
+</html>
+'''
+
+def _split_pairs(pairs):
+    """Split (label, count) pairs into parallel label and count lists"""
+    return [label for label, _ in pairs], [count for _, count in pairs]
+
+# Chart builders are module-level and take only the values they plot
+def _overview_chart(summary, viral, high_eng):
+    """Create overview metrics chart"""
+    metrics = [
+        ("Total Messages", summary['total_messages_analyzed']),
+        ("Relevant Messages", summary['relevant_messages_found']),
+        ("Viral Messages", viral),
+        ("High Engagement", high_eng)
+    ]
+    
+    # Create metrics visualization
+    fig = go.Figure(
+        data=[go.Bar(
             x=[m[0] for m in metrics],
             y=[m[1] for m in metrics],
             name="Overview Metrics",
             marker_color=['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
-        ))
-        
-        fig.update_layout(
+        )],
+        layout=dict(
             title="📊 Analysis Overview Metrics",
             xaxis_title="Metric",
             yaxis_title="Count",
             height=400
         )
-        
-        return pyo.plot(fig, output_type='div', include_plotlyjs=False)
+    )
     
-    def create_category_chart(self):
-        """Create category distribution chart"""
-        if not self.summary_data or 'category_distribution' not in self.summary_data:
-            return ""
-        
-        categories = self.summary_data['category_distribution']
-        
-        # Pie chart
-        fig = px.pie(
+    return fig.to_json()
+
+def _category_chart(categories):
+    """Create category distribution chart"""
+    if not categories:
+        return ""
+    
+    # Pie chart
+    fig = go.Figure(
+        data=[go.Pie(
             values=list(categories.values()),
-            names=list(categories.keys()),
+            labels=list(categories.keys()),
+            textposition='inside',
+            textinfo='percent+label'
+        )],
+        layout=dict(
             title="📈 Anti-Gender Content Categories Distribution",
-            color_discrete_sequence=px.colors.qualitative.Set3
+            piecolorway=px.colors.qualitative.Set3
         )
-        fig.update_traces(textposition='inside', textinfo='percent+label')
-        
-        return pyo.plot(fig, output_type='div', include_plotlyjs=False)
+    )
     
-    def create_subcategory_chart(self):
-        """Create subcategory analysis chart"""
-        if not self.summary_data or 'subcategory_distribution' not in self.summary_data:
-            return ""
-        
-        subcats = self.summary_data['subcategory_distribution']
-        top_subcats = dict(list(subcats.items())[:10])
-        
-        fig = px.bar(
-            x=list(top_subcats.values()),
-            y=list(top_subcats.keys()),
+    return fig.to_json()
+
+def _subcategory_chart(subcats, counts):
+    """Create subcategory analysis chart"""
+    if not subcats:
+        return ""
+    
+    fig = go.Figure(
+        data=[go.Bar(
+            x=counts,
+            y=subcats,
             orientation='h',
+            marker=dict(color=counts, colorscale='plasma', showscale=True)
+        )],
+        layout=dict(
             title="🔍 Top 10 Subcategories",
-            labels={'x': 'Number of Messages', 'y': 'Subcategory'},
-            color=list(top_subcats.values()),
-            color_continuous_scale='plasma'
+            xaxis_title="Number of Messages",
+            yaxis_title="Subcategory",
+            height=500
         )
-        fig.update_layout(height=500)
-        
-        return pyo.plot(fig, output_type='div', include_plotlyjs=False)
+    )
     
-    def create_intensity_chart(self):
-        """Create intensity distribution chart"""
-        if not self.summary_data or 'intensity_distribution' not in self.summary_data:
-            return ""
-        
-        intensity = self.summary_data['intensity_distribution']
-        
-        levels = [f"Level {k}" for k in sorted(intensity.keys())]
-        counts = [intensity[k] for k in sorted(intensity.keys())]
-        
-        fig = px.bar(
-            x=levels,
+    return fig.to_json()
+
+def _intensity_chart(intensity_levels, counts):
+    """Create intensity distribution chart"""
+    if not intensity_levels:
+        return ""
+    
+    fig = go.Figure(
+        data=[go.Bar(
+            x=[f"Level {k}" for k in intensity_levels],
             y=counts,
+            marker=dict(color=counts, colorscale='reds', showscale=True)
+        )],
+        layout=dict(
             title="⚡ Message Intensity Distribution",
-            labels={'x': 'Intensity Level', 'y': 'Number of Messages'},
-            color=counts,
-            color_continuous_scale='reds'
+            xaxis_title="Intensity Level",
+            yaxis_title="Number of Messages"
         )
-        
-        return pyo.plot(fig, output_type='div', include_plotlyjs=False)
+    )
     
-    def create_linguistic_markers_chart(self):
-        """Create linguistic markers chart"""
-        if not self.summary_data or 'top_linguistic_markers' not in self.summary_data:
-            return ""
-        
-        markers = self.summary_data['top_linguistic_markers']
-        top_markers = dict(list(markers.items())[:15])
-        
-        fig = px.bar(
-            x=list(top_markers.values()),
-            y=list(top_markers.keys()),
+    return fig.to_json()
+
+def _linguistic_markers_chart(markers, counts):
+    """Create linguistic markers chart"""
+    if not markers:
+        return ""
+    
+    fig = go.Figure(
+        data=[go.Bar(
+            x=counts,
+            y=markers,
             orientation='h',
+            marker=dict(color=counts, colorscale='viridis', showscale=True)
+        )],
+        layout=dict(
             title="💬 Top 15 Linguistic Markers",
-            labels={'x': 'Occurrences', 'y': 'Linguistic Marker'},
-            color=list(top_markers.values()),
-            color_continuous_scale='viridis'
+            xaxis_title="Occurrences",
+            yaxis_title="Linguistic Marker",
+            height=600
         )
-        fig.update_layout(height=600)
-        
-        return pyo.plot(fig, output_type='div', include_plotlyjs=False)
+    )
     
-    def create_engagement_chart(self):
-        """Create engagement analysis chart"""
-        if self.df is None:
-            return ""
-        
-        # Views vs Forwards scatter plot
-        fig = px.scatter(
-            self.df,
-            x='Views',
-            y='Forwards',
-            color='Intensity_Score',
+    return fig.to_json()
+
+def _engagement_chart(views, forwards, intensity, categories):
+    """Create engagement analysis chart"""
+    # Views vs Forwards scatter plot
+    fig = go.Figure(
+        data=[go.Scatter(
+            x=views,
+            y=forwards,
+            mode='markers',
+            marker=dict(
+                color=intensity,
+                colorscale='viridis',
+                showscale=True,
+                colorbar=dict(title='Intensity_Score')
+            ),
+            customdata=categories,
+            hovertemplate="Views=%{x}<br>Forwards=%{y}<br>Categories=%{customdata}<extra></extra>"
+        )],
+        layout=dict(
             title="🚀 Views vs Forwards Relationship",
-            labels={'x': 'Views', 'y': 'Forwards'},
-            hover_data=['Categories'],
-            color_continuous_scale='viridis'
+            xaxis_title="Views",
+            yaxis_title="Forwards"
         )
-        
-        return pyo.plot(fig, output_type='div', include_plotlyjs=False)
+    )
     
-    def create_media_chart(self):
-        """Create media content analysis chart"""
-        if not self.summary_data:
-            return ""
-        
-        media_count = self.summary_data.get('content_with_media', 0)
-        total_relevant = self.summary_data['analysis_summary']['relevant_messages_found']
-        
-        fig = px.pie(
+    return fig.to_json()
+
+def _media_chart(media_count, total_relevant):
+    """Create media content analysis chart"""
+    fig = go.Figure(
+        data=[go.Pie(
             values=[media_count, total_relevant - media_count],
-            names=['With Media', 'Text Only'],
-            title="📸 Media Content Distribution",
-            color_discrete_sequence=['#ff7f0e', '#1f77b4']
-        )
-        
-        return pyo.plot(fig, output_type='div', include_plotlyjs=False)
+            labels=['With Media', 'Text Only'],
+            marker_colors=['#ff7f0e', '#1f77b4']
+        )],
+        layout=dict(title="📸 Media Content Distribution")
+    )
     
-    def create_timeline_chart(self):
-        """Create timeline analysis chart"""
-        if self.df is None or 'Date' not in self.df.columns:
-            return ""
-        
-        # Ensure Date column is datetime
-        if not pd.api.types.is_datetime64_any_dtype(self.df['Date']):
-            self.df['Date'] = pd.to_datetime(self.df['Date'])
-        
-        # Group by date and count messages
-        daily_counts = self.df.groupby(self.df['Date'].dt.date).size().reset_index()
-        daily_counts.columns = ['Date', 'Messages']
+    return fig.to_json()
+
+class StaticDashboardGenerator:
+    def __init__(self, csv_path, json_path):
+        self.csv_path = csv_path
+        self.json_path = json_path
+        self.df = None
+        self.summary_data = None
+        self.charts = []
         
-        fig = px.line(
-            daily_counts,
-            x='Date',
-            y='Messages',
-            title="📅 Daily Message Volume Timeline",
-            labels={'x': 'Date', 'y': 'Number of Messages'}
-        )
-        fig.update_traces(line=dict(color='#1f77b4', width=3))
-        fig.update_layout(height=400)
+        # Chart inputs derived from summary_data by prepare_aggregates
+        self._top_subcats = ([], [])
+        self._top_markers = ([], [])
+        self._intensity_sorted = ([], [])
+        self._viral = 0
+        self._high_eng = 0
         
-        return pyo.plot(fig, output_type='div', include_plotlyjs=False)
+    def load_data(self):
+        """Load analysis data"""
+        try:
+            self.df = pd.read_csv(self.csv_path, dtype=_CSV_DTYPES)
+            self.downcast_columns()
+            with open(self.json_path, 'rb') as f:
+                self.summary_data = _json_loads(f.read())
+            self.prepare_aggregates()
+            print("✅ Data loaded successfully")
+            return True
+        except Exception as e:
+            print(f"❌ Error loading data: {e}")
+            return False
     
-    def create_views_distribution_chart(self):
-        """Create views distribution histogram"""
-        if self.df is None:
-            return ""
-        
-        fig = px.histogram(
-            self.df,
-            x='Views',
-            nbins=30,
-            title="👀 Views Distribution Analysis",
-            labels={'x': 'Views', 'y': 'Number of Messages'},
-            color_discrete_sequence=['#2ca02c']
-        )
-        fig.update_layout(height=400)
+    def downcast_columns(self):
+        """Narrow numeric columns so figures embed compact typed arrays"""
+        for column in _INTEGER_COLUMNS:
+            if column in self.df.columns:
+                self.df[column] = pd.to_numeric(self.df[column], downcast='integer')
+    
+    def prepare_aggregates(self):
+        """Derive the sorted and top-N summary slices the charts plot"""
+        self._top_subcats = _split_pairs(heapq.nlargest(
+            10, self.summary_data.get('subcategory_distribution', {}).items(), key=itemgetter(1)
+        ))
+        self._top_markers = _split_pairs(heapq.nlargest(
+            15, self.summary_data.get('top_linguistic_markers', {}).items(), key=itemgetter(1)
+        ))
+        self._intensity_sorted = _split_pairs(sorted(
+            self.summary_data.get('intensity_distribution', {}).items(), key=lambda kv: int(kv[0])
+        ))
         
-        return pyo.plot(fig, output_type='div', include_plotlyjs=False)
+        engagement = self.summary_data.get('engagement_analysis', {})
+        self._viral = engagement.get('viral_messages', 0)
+        self._high_eng = engagement.get('high_engagement_messages', 0)
+    
+    def chart_tasks(self):
+        """Map each chart id to its builder and the inputs it plots"""
+        tasks = {}
+        if self.summary_data:
+            tasks['overview_chart'] = (_overview_chart, (self.summary_data['analysis_summary'], self._viral, self._high_eng))
+            tasks['category_chart'] = (_category_chart, (self.summary_data.get('category_distribution'),))
+            tasks['subcategory_chart'] = (_subcategory_chart, self._top_subcats)
+            tasks['intensity_chart'] = (_intensity_chart, self._intensity_sorted)
+            tasks['linguistic_markers_chart'] = (_linguistic_markers_chart, self._top_markers)
+            tasks['media_chart'] = (_media_chart, (
+                self.summary_data.get('content_with_media', 0),
+                self.summary_data['analysis_summary']['relevant_messages_found']
+            ))
+        if self.df is not None:
+            tasks['engagement_chart'] = (_engagement_chart, (
+                self.df['Views'].to_numpy(),
+                self.df['Forwards'].to_numpy(),
+                self.df['Intensity_Score'].to_numpy(),
+                self.df['Categories'].to_numpy()
+            ))
+        return tasks
     
     def load_sample_data(self):
         """Load comprehensive sample data for demonstration"""
@@ -294,256 +530,150 @@ class StaticDashboardGenerator:
             }
         }
         
-        # Create realistic sample DataFrame
-        np.random.seed(42)  # For reproducible results
-        sample_data = []
+        # Create realistic sample DataFrame as typed columns, one vectorized draw per column
+        n_messages = self.summary_data['analysis_summary']['relevant_messages_found']
+        rng = np.random.default_rng(42)  # For reproducible results
         categories = list(self.summary_data['category_distribution'].keys())
         subcategories = list(self.summary_data['subcategory_distribution'].keys())
         
-        # Generate diverse sample data
-        for i in range(1315):
-            category = np.random.choice(categories, p=[0.947, 0.027, 0.023, 0.003])
-            subcategory = np.random.choice(subcategories[:4])  # Top 4 subcategories
-            intensity = np.random.choice([1, 2], p=[0.998, 0.002])
-            
-            # Generate realistic view and forward counts
-            views = int(np.random.lognormal(7.5, 1.5))  # Log-normal distribution
-            views = max(100, min(views, 89000))  # Constrain to realistic range
-            
-            forwards = int(np.random.poisson(2.1))  # Poisson distribution
-            forwards = max(0, min(forwards, 20))  # Constrain to realistic range
-            
-            # Generate dates over the past year
-            date = datetime.now() - timedelta(days=np.random.randint(0, 365))
-            
-            sample_data.append({
-                'Message_ID': f'msg_{i+1:04d}',
-                'Text_Preview': f'Sample anti-gender message content {i+1}... [religious framing, cultural authenticity, moral opposition]',
-                'Categories': category,
-                'Subcategories': subcategory,
-                'Intensity_Score': intensity,
-                'Views': views,
-                'Forwards': forwards,
-                'Date': date,
-                'Has_Media': np.random.choice([True, False], p=[0.53, 0.47])
-            })
-        
-        self.df = pd.DataFrame(sample_data)
-        self.df['Date'] = pd.to_datetime(self.df['Date'])
+        message_numbers = np.arange(1, n_messages + 1).astype(str)
+        
+        # Generate realistic view and forward counts
+        views = np.clip(rng.lognormal(7.5, 1.5, n_messages), 100, 89000).astype(np.int32)  # Log-normal distribution
+        forwards = np.clip(rng.poisson(2.1, n_messages), 0, 20).astype(np.int32)  # Poisson distribution
+        
+        # Generate dates over the past year
+        now = np.datetime64(datetime.now().replace(microsecond=0), 's')
+        dates = now - rng.integers(0, 365, n_messages).astype('timedelta64[D]')
+        
+        self.df = pd.DataFrame({
+            'Message_ID': np.char.add('msg_', np.char.zfill(message_numbers, 4)),
+            'Text_Preview': np.char.add(
+                np.char.add('Sample anti-gender message content ', message_numbers),
+                '... [religious framing, cultural authenticity, moral opposition]'
+            ),
+            'Categories': pd.Categorical(
+                rng.choice(categories, size=n_messages, p=[0.947, 0.027, 0.023, 0.003]),
+                categories=categories
+            ),
+            'Subcategories': pd.Categorical(
+                rng.choice(subcategories[:4], size=n_messages),  # Top 4 subcategories
+                categories=subcategories[:4]
+            ),
+            'Intensity_Score': rng.choice([1, 2], size=n_messages, p=[0.998, 0.002]),
+            'Views': views,
+            'Forwards': forwards,
+            'Date': dates,
+            'Has_Media': rng.random(n_messages) < 0.53
+        }, copy=False)
+        self.downcast_columns()
+        self.prepare_aggregates()
         
         print("✅ Sample data loaded successfully")
         return True
     
+    def source_fingerprint(self):
+        """Fingerprint the input files by modification time and size"""
+        try:
+            parts = []
+            for path in (self.csv_path, self.json_path):
+                stat = os.stat(path)
+                parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+            return ";".join(parts)
+        except OSError:
+            return None
+    
+    def is_up_to_date(self, output_path, fingerprint):
+        """Check whether an existing dashboard was built from the same inputs"""
+        try:
+            with open(output_path, 'r', encoding='utf-8') as f:
+                header = f.read(200)
+        except OSError:
+            return False
+        return _FINGERPRINT_TEMPLATE.format(fingerprint=fingerprint) in header
+    
     def generate_html_dashboard(self, output_path="telegram_analysis_dashboard.html", use_sample_data=False):
         """Generate complete HTML dashboard"""
+        fingerprint = None
         if use_sample_data:
             if not self.load_sample_data():
                 return False
         else:
+            fingerprint = self.source_fingerprint()
+            if fingerprint and self.is_up_to_date(output_path, fingerprint):
+                print(f"✅ Static dashboard is up to date: {output_path}")
+                return True
             if not self.load_data():
                 return False
         
         print("📊 Generating charts...")
         
-        # Generate all charts
-        overview_chart = self.create_overview_chart()
-        category_chart = self.create_category_chart()
-        subcategory_chart = self.create_subcategory_chart()
-        intensity_chart = self.create_intensity_chart()
-        linguistic_chart = self.create_linguistic_markers_chart()
-        engagement_chart = self.create_engagement_chart()
-        media_chart = self.create_media_chart()
-        timeline_chart = self.create_timeline_chart()
-        views_chart = self.create_views_distribution_chart()
-        
         # Get summary statistics
         summary = self.summary_data['analysis_summary']
-        engagement = self.summary_data.get('engagement_analysis', {})
         
-        # HTML template
-        html_content = f'''
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Telegram Analysis Dashboard</title>
-            <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-            <style>
-                body {{
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    margin: 0;
-                    padding: 20px;
-                    background-color: #f5f5f5;
-                }}
-                .container {{
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    background-color: white;
-                    border-radius: 10px;
-                    padding: 30px;
-                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-                }}
-                .header {{
-                    text-align: center;
-                    margin-bottom: 40px;
-                    color: #2c3e50;
-                }}
-                .header h1 {{
-                    font-size: 2.5em;
-                    margin-bottom: 10px;
-                    color: #1f77b4;
-                }}
-                .header p {{
-                    font-size: 1.2em;
-                    color: #7f8c8d;
-                }}
-                .metrics-grid {{
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                    gap: 20px;
-                    margin-bottom: 40px;
-                }}
-                .metric-card {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 20px;
-                    border-radius: 10px;
-                    text-align: center;
-                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-                }}
-                .metric-value {{
-                    font-size: 2em;
-                    font-weight: bold;
-                    margin-bottom: 5px;
-                }}
-                .metric-label {{
-                    font-size: 0.9em;
-                    opacity: 0.9;
-                }}
-                .chart-container {{
-                    margin-bottom: 40px;
-                    background: white;
-                    border-radius: 8px;
-                    padding: 20px;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                }}
-                .chart-grid {{
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(500px, 1fr));
-                    gap: 30px;
-                    margin-bottom: 40px;
-                }}
-                .insights {{
-                    background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
-                    color: white;
-                    padding: 30px;
-                    border-radius: 10px;
-                    margin-top: 40px;
-                }}
-                .insights h3 {{
-                    margin-top: 0;
-                    font-size: 1.5em;
-                }}
-                .insights ul {{
-                    margin: 0;
-                    padding-left: 20px;
-                }}
-                .insights li {{
-                    margin-bottom: 10px;
-                }}
-                .timestamp {{
-                    text-align: center;
-                    color: #7f8c8d;
-                    margin-top: 40px;
-                    padding-top: 20px;
-                    border-top: 1px solid #ecf0f1;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>📊 Telegram Analysis Dashboard</h1>
-                    <p>Anti-Gender Narratives Analysis - DMCA Thematic Coding Framework v1.0</p>
-                </div>
-                
-                <div class="metrics-grid">
-                    <div class="metric-card">
-                        <div class="metric-value">{summary['total_messages_analyzed']:,}</div>
-                        <div class="metric-label">Total Messages Analyzed</div>
-                    </div>
-                    <div class="metric-card">
-                        <div class="metric-value">{summary['relevant_messages_found']:,}</div>
-                        <div class="metric-label">Relevant Messages Found</div>
-                    </div>
-                    <div class="metric-card">
-                        <div class="metric-value">{summary['relevance_rate']:.2f}%</div>
-                        <div class="metric-label">Relevance Rate</div>
-                    </div>
-                    <div class="metric-card">
-                        <div class="metric-value">{engagement.get('viral_messages', 0):,}</div>
-                        <div class="metric-label">Viral Messages</div>
-                    </div>
-                </div>
-                
-                <div class="chart-container">
-                    {overview_chart}
-                </div>
-                
-                <div class="chart-grid">
-                    <div class="chart-container">
-                        {category_chart}
-                    </div>
-                    <div class="chart-container">
-                        {intensity_chart}
-                    </div>
-                </div>
-                
-                <div class="chart-container">
-                    {subcategory_chart}
-                </div>
-                
-                <div class="chart-container">
-                    {linguistic_chart}
-                </div>
-                
-                <div class="chart-grid">
-                    <div class="chart-container">
-                        {engagement_chart}
-                    </div>
-                    <div class="chart-container">
-                        {media_chart}
-                    </div>
-                </div>
+        # Each chart is built from its precomputed inputs as its turn comes up,
+        # so the page streams to disk without holding every figure in memory
+        tasks = self.chart_tasks()
+        
+        # Stream into a temp file beside the target and swap it in only once the
+        # page is complete, so a failed run never leaves a partial fingerprinted
+        # page behind or clobbers the previous dashboard
+        tmp_path = f"{output_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(_DOCTYPE)
+                if fingerprint:
+                    f.write(_FINGERPRINT_TEMPLATE.format(fingerprint=fingerprint))
+                f.write(_HTML_HEAD)
+                f.write(_PLOTLY_SCRIPT_TEMPLATE.format(version=get_plotlyjs_version()))
+                f.write(_HTML_STYLE)
+                f.write(_METRICS_TEMPLATE.format(
+                    total_messages=summary['total_messages_analyzed'],
+                    relevant_messages=summary['relevant_messages_found'],
+                    relevance_rate=summary['relevance_rate'],
+                    viral_messages=self._viral
+                ))
                 
-                <div class="insights">
-                    <h3>🧠 Key Research Insights</h3>
-                    <ul>
-                        <li><strong>Religious Opposition Dominance:</strong> 97% of coded content uses religious framing with "sin" appearing 977 times</li>
-                        <li><strong>Sophisticated Messaging Strategy:</strong> 99.9% content at Level 1 intensity, designed to evade content moderation</li>
-                        <li><strong>High Viral Potential:</strong> 85.9% of relevant messages were forwarded, indicating strong engagement</li>
-                        <li><strong>Coordinated Campaign Evidence:</strong> "Masculinity Saturday" recurring pattern suggests organized efforts</li>
-                        <li><strong>Media Strategy:</strong> 53% of relevant messages include multimedia content for increased viral potential</li>
-                    </ul>
-                </div>
+                for row in _CHART_LAYOUT:
+                    in_grid = len(row) > 1
+                    if in_grid:
+                        f.write(_GRID_OPEN)
+                    for chart_name in row:
+                        f.write(_CHART_OPEN)
+                        figure_json = ""
+                        if chart_name in tasks:
+                            builder, args = tasks[chart_name]
+                            figure_json = builder(*args)
+                        if figure_json:
+                            f.write(_FIGURE_TEMPLATE.format(
+                                chart_id=chart_name,
+                                figure_json=figure_json.replace('</', '<\\/')
+                            ))
+                        f.write(_CHART_CLOSE)
+                    if in_grid:
+                        f.write(_GRID_CLOSE)
                 
-                <div class="timestamp">
-                    <p>Analysis generated on {datetime.now().strftime("%B %d, %Y at %I:%M %p")}</p>
-                    <p>Framework: DMCA Thematic Coding Guide v1.0 | Analyst: Chaos</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        '''
-        
-        # Save HTML file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+                f.write(_INSIGHTS_HTML)
+                f.write(_FOOTER_TEMPLATE.format(
+                    generated_at=datetime.now().strftime("%B %d, %Y at %I:%M %p")
+                ))
+                f.write(_PLOTLY_BOOTSTRAP)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         
         print(f"✅ Static dashboard generated: {output_path}")
         return True
 
+def _has_data(path):
+    """Check with a single stat call that a results file exists and is not empty"""
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
 def main():
     print("🚀 Generating Static HTML Dashboard...")
     
@@ -551,14 +681,17 @@ def main():
     csv_path = "../combined_analysis_results/coded_messages_detailed.csv"
     json_path = "../combined_analysis_results/analysis_summary.json"
     
+    results_found = _has_data(csv_path) and _has_data(json_path)
+    
     # Fallback to single dataset if combined doesn't exist
-    if not os.path.exists(csv_path) or not os.path.exists(json_path):
+    if not results_found:
         csv_path = "../telegram_analysis_results/coded_messages_detailed.csv"
         json_path = "../telegram_analysis_results/analysis_summary.json"
+        results_found = _has_data(csv_path) and _has_data(json_path)
     
     # Generate dashboard - use sample data if analysis files don't exist
     generator = StaticDashboardGenerator(csv_path, json_path)
-    use_sample = not (os.path.exists(csv_path) and os.path.exists(json_path))
+    use_sample = not results_found
     
     if use_sample:
         print("📊 Analysis results not found, generating dashboard with comprehensive sample data...")
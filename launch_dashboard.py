@@ -7,9 +7,9 @@ Author: Chaos
 Date: August 2025
 """
 
-import os
 import sys
-import subprocess
+
+from generate_static_dashboard import _has_data
 
 def main():
     print("🚀 Launching Telegram Analysis Dashboard...")
@@ -21,9 +21,9 @@ def main():
     single_csv = "../telegram_analysis_results/coded_messages_detailed.csv"
     single_json = "../telegram_analysis_results/analysis_summary.json"
     
-    if os.path.exists(combined_csv) and os.path.exists(combined_json):
+    if _has_data(combined_csv) and _has_data(combined_json):
         print("✅ Combined analysis results found (12,000 messages)!")
-    elif os.path.exists(single_csv) and os.path.exists(single_json):
+    elif _has_data(single_csv) and _has_data(single_json):
         print("✅ Single dataset analysis results found (6,000 messages)!")
     else:
         print("❌ Error: Analysis results not found!")
@@ -37,13 +37,16 @@ def main():
     print("="*50 + "\n")
     
     try:
-        # Launch Streamlit dashboard
-        subprocess.run([
+        # Launch Streamlit dashboard in this interpreter instead of a subprocess
+        from streamlit.web import cli as stcli
+        
+        sys.argv = [
             "streamlit", "run", "telegram_analysis_dashboard.py",
             "--server.headless", "false",
             "--server.port", "8501",
             "--browser.gatherUsageStats", "false"
-        ])
+        ]
+        sys.exit(stcli.main())
     except KeyboardInterrupt:
         print("\n🛑 Dashboard stopped by user")
     except Exception as e:
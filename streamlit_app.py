@@ -9,6 +9,7 @@ Date: August 2025
 """
 
 import streamlit as st
+from streamlit.runtime.uploaded_file_manager import UploadedFile
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -19,7 +20,13 @@ import numpy as np
 from datetime import datetime, timedelta
 import re
 import base64
-from io import StringIO
+
+# Prefer orjson for parsing the summary file when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Page configuration
 st.set_page_config(
@@ -30,7 +37,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -72,24 +79,205 @@ st.markdown("""
         background-color: #f8f9fa;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Static copy for the insights page
+_INSIGHTS_MD_LEFT = """
+**1. Religious Opposition Dominance**
+- 97% of coded content uses religious framing
+- "Sin" appears 977 times as primary marker
+- Leverages established authority structures
+
+**2. Sophisticated Messaging Strategy**  
+- 99.9% content at Level 1 intensity (subtle)
+- Designed to evade content moderation
+- High viral potential (85.9% forwarded)
+
+**3. Coordinated Campaign Evidence**
+- "Masculinity Saturday" recurring pattern
+- 53% multimedia content strategy
+- Targeted male demographic engagement
+"""
+
+_INSIGHTS_MD_RIGHT = """
+**Immediate Actions:**
+- Implement Level 1 intensity detection systems
+- Engage progressive faith leaders for counter-messaging
+- Develop compelling visual counter-narratives
+
+**Medium-Term Strategies:**
+- Platform algorithm transparency advocacy
+- Longitudinal content evolution tracking
+- Cross-platform analysis expansion
+
+**Long-Term Goals:**
+- Address underlying socioeconomic factors
+- Critical media literacy education integration
+- Evidence-based platform regulation development
+"""
+
+# Only the columns the dashboard reads are parsed from uploaded CSVs
+_CSV_COLUMNS = {'Message_ID', 'Categories', 'Subcategories', 'Intensity_Score', 'Views', 'Forwards', 'Date'}
+
+# Repeated label columns are parsed as categoricals and counter columns are
+# downcast to the narrowest integer type that holds their values
+_CSV_DTYPES = {
+    'Categories': 'category',
+    'Subcategories': 'category'
+}
+_INTEGER_COLUMNS = ('Views', 'Forwards', 'Intensity_Score')
+
+# Key cached parsers on the upload's id instead of hashing its full contents
+_UPLOAD_HASH_FUNCS = {UploadedFile: lambda uploaded_file: uploaded_file.file_id}
+
+@st.cache_data(show_spinner=False, max_entries=4, hash_funcs=_UPLOAD_HASH_FUNCS)
+def _parse_csv(csv_file):
+    """Parse an uploaded CSV; cached so reruns skip re-parsing"""
+    # UploadedFile is already a BytesIO, so read it in place from the start
+    csv_file.seek(0)
+    df = pd.read_csv(csv_file, usecols=lambda column: column in _CSV_COLUMNS, dtype=_CSV_DTYPES)
+    for column in _INTEGER_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], downcast='integer')
+    return df
+
+@st.cache_data(show_spinner=False, max_entries=4, hash_funcs=_UPLOAD_HASH_FUNCS)
+def _parse_json(json_file):
+    """Parse an uploaded JSON summary; cached so reruns skip re-parsing"""
+    json_file.seek(0)
+    return _json_loads(json_file.read())
+
+# Scatter plots with more rows than this are downsampled before plotting
+_SCATTER_POINT_LIMIT = 4000
+
+def _m4_downsample(df, x, y, width=1000):
+    """Reduce a scatter to the M4 points (min/max of x and y) of each pixel column"""
+    # Rows missing either coordinate are never drawn, and an all-NaN pixel
+    # column would make idxmin/idxmax raise
+    df = df.dropna(subset=[x, y])
+    if df.empty:
+        return df
+    x_values = df[x].to_numpy(dtype=np.float64)
+    edges = np.linspace(np.nanmin(x_values), np.nanmax(x_values), width + 1)
+    pixel_columns = pd.Series(np.digitize(x_values, edges[1:-1]), index=df.index)
+    
+    grouped = df.groupby(pixel_columns)
+    keep = pd.concat([
+        grouped[x].idxmin(), grouped[x].idxmax(),
+        grouped[y].idxmin(), grouped[y].idxmax()
+    ]).unique()
+    return df.loc[np.sort(keep)]
+
+def _df_fingerprint(df):
+    """Cheap cache key for a DataFrame: row count plus a vectorized content hash"""
+    return len(df), int(pd.util.hash_pandas_object(df, index=False).sum())
+
+# Figure builders are cached on hashable inputs and return plain figure dicts,
+# so switching pages does not rebuild figures that have already been drawn.
+# DataFrame arguments are prefixed with _ so Streamlit keys on the fingerprint.
+@st.cache_data(show_spinner=False, max_entries=16)
+def _category_pie_figure(names, values):
+    """Build the category distribution pie chart"""
+    names, values = np.asarray(names), np.asarray(values)
+    fig_pie = go.Figure(
+        data=[go.Pie(
+            values=values,
+            labels=names,
+            textposition='inside',
+            textinfo='percent+label'
+        )],
+        layout=dict(
+            title="Distribution of Anti-Gender Content Categories",
+            piecolorway=px.colors.qualitative.Set3
+        )
+    )
+    return fig_pie.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _category_bar_figure(names, values):
+    """Build the message count by category bar chart"""
+    names, values = np.asarray(names), np.asarray(values)
+    fig_bar = go.Figure(
+        data=[go.Bar(
+            x=names,
+            y=values,
+            marker=dict(color=values, colorscale='Viridis', showscale=True)
+        )],
+        layout=dict(
+            title="Message Count by Category",
+            xaxis=dict(title="Category", tickangle=-45),
+            yaxis_title="Number of Messages"
+        )
+    )
+    return fig_bar.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _views_histogram_figure(df_fingerprint, _df):
+    """Build the views histogram, binned here so only the bar heights are sent"""
+    counts, edges = np.histogram(_df['Views'].dropna().to_numpy(), bins=30)
+    fig = go.Figure(
+        data=[go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges))],
+        layout=dict(
+            title="Distribution of Message Views",
+            xaxis_title="Views",
+            yaxis_title="Number of Messages",
+            bargap=0
+        )
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _engagement_scatter_figure(df_fingerprint, _df):
+    """Build the views vs forwards scatter, reduced to the points that shape it on screen"""
+    scatter_df = _df
+    if len(scatter_df) > _SCATTER_POINT_LIMIT:
+        scatter_df = _m4_downsample(scatter_df, 'Views', 'Forwards')
+    fig = go.Figure(
+        data=[go.Scattergl(
+            x=scatter_df['Views'].to_numpy(),
+            y=scatter_df['Forwards'].to_numpy(),
+            mode='markers',
+            marker=dict(
+                color=scatter_df['Intensity_Score'].to_numpy(),
+                colorscale='Viridis',
+                showscale=True,
+                colorbar=dict(title='Intensity_Score')
+            ),
+            customdata=scatter_df['Categories'].to_numpy(),
+            hovertemplate="Views=%{x}<br>Forwards=%{y}<br>Categories=%{customdata}<extra></extra>"
+        )],
+        layout=dict(
+            title="Views vs Forwards Relationship",
+            xaxis_title="Views",
+            yaxis_title="Forwards"
+        )
+    )
+    return fig.to_dict()
+
+@st.cache_resource
+def _inject_css():
+    """Emit the custom CSS; Streamlit replays the cached element on every rerun"""
+    st.markdown(_CSS, unsafe_allow_html=True)
 
 class TelegramAnalysisDashboard:
     def __init__(self):
-        self.df = None
-        self.summary_data = None
+        # Hydrate from the session so loaded data survives Streamlit reruns
+        self.df = st.session_state.get('df')
+        self.summary_data = st.session_state.get('summary_data')
+        self.df_fingerprint = st.session_state.get('df_fingerprint')
         
     def load_data_from_files(self, csv_file, json_file):
         """Load analysis data from uploaded files"""
         try:
-            # Read CSV
-            csv_content = csv_file.getvalue().decode('utf-8')
-            self.df = pd.read_csv(StringIO(csv_content))
-            
-            # Read JSON
-            json_content = json_file.getvalue().decode('utf-8')
-            self.summary_data = json.loads(json_content)
+            # Parse through the cached helpers, keyed on the upload ids
+            self.df = _parse_csv(csv_file)
+            self.summary_data = _parse_json(json_file)
+            # Fingerprint once per load; the cached figure builders key on it
+            self.df_fingerprint = _df_fingerprint(self.df)
             
+            st.session_state['df'] = self.df
+            st.session_state['summary_data'] = self.summary_data
+            st.session_state['df_fingerprint'] = self.df_fingerprint
             return True
         except Exception as e:
             st.error(f"Error loading data: {str(e)}")
@@ -143,22 +331,29 @@ class TelegramAnalysisDashboard:
             }
         }
         
-        # Create sample DataFrame
-        sample_data = []
-        for i in range(1315):
-            sample_data.append({
-                'Message_ID': f'msg_{i+1}',
-                'Text_Preview': f'Sample message content {i+1}...',
-                'Categories': 'LGBTQ+ Hate Speech & Anti-Rights Rhetoric',
-                'Subcategories': '3.religious_opposition',
-                'Intensity_Score': 1,
-                'Views': np.random.randint(100, 50000),
-                'Forwards': np.random.randint(0, 10),
-                'Date': pd.date_range('2024-01-01', periods=1315)[i % 365]
-            })
+        # Create sample DataFrame column-wise in one vectorized pass
+        n_messages = 1315
+        rng = np.random.default_rng(0)
+        message_numbers = np.arange(1, n_messages + 1).astype(str)
+        # Build the year of dates once and gather it cyclically
+        dates_pool = pd.date_range('2024-01-01', periods=365).to_numpy()
         
-        self.df = pd.DataFrame(sample_data)
+        self.df = pd.DataFrame({
+            'Message_ID': np.char.add('msg_', message_numbers),
+            'Text_Preview': np.char.add(np.char.add('Sample message content ', message_numbers), '...'),
+            'Categories': 'LGBTQ+ Hate Speech & Anti-Rights Rhetoric',
+            'Subcategories': '3.religious_opposition',
+            'Intensity_Score': np.int8(1),
+            'Views': rng.integers(100, 50000, n_messages, dtype=np.int32),
+            'Forwards': rng.integers(0, 10, n_messages, dtype=np.int8),
+            'Date': dates_pool[np.arange(n_messages) % len(dates_pool)]
+        }).astype({'Categories': 'category', 'Subcategories': 'category'})
         self.summary_data = sample_summary
+        self.df_fingerprint = _df_fingerprint(self.df)
+        
+        st.session_state['df'] = self.df
+        st.session_state['summary_data'] = self.summary_data
+        st.session_state['df_fingerprint'] = self.df_fingerprint
         return True
     
     def create_overview_metrics(self):
@@ -168,6 +363,7 @@ class TelegramAnalysisDashboard:
         
         if self.summary_data:
             summary = self.summary_data['analysis_summary']
+            engagement = self.summary_data.get('engagement_analysis', {})
             
             col1, col2, col3, col4 = st.columns(4)
             
@@ -193,7 +389,6 @@ class TelegramAnalysisDashboard:
                 )
             
             with col4:
-                engagement = self.summary_data.get('engagement_analysis', {})
                 st.metric(
                     "Viral Messages",
                     f"{engagement.get('viral_messages', 0):,}",
@@ -209,29 +404,16 @@ class TelegramAnalysisDashboard:
             
             col1, col2 = st.columns(2)
             
+            names = tuple(categories.keys())
+            values = tuple(categories.values())
+            
             with col1:
                 # Pie chart for category distribution
-                fig_pie = px.pie(
-                    values=list(categories.values()),
-                    names=list(categories.keys()),
-                    title="Distribution of Anti-Gender Content Categories",
-                    color_discrete_sequence=px.colors.qualitative.Set3
-                )
-                fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-                st.plotly_chart(fig_pie, use_container_width=True)
+                st.plotly_chart(_category_pie_figure(names, values), use_container_width=True)
             
             with col2:
                 # Bar chart for category counts
-                fig_bar = px.bar(
-                    x=list(categories.keys()),
-                    y=list(categories.values()),
-                    title="Message Count by Category",
-                    labels={'x': 'Category', 'y': 'Number of Messages'},
-                    color=list(categories.values()),
-                    color_continuous_scale='viridis'
-                )
-                fig_bar.update_layout(xaxis_tickangle=-45)
-                st.plotly_chart(fig_bar, use_container_width=True)
+                st.plotly_chart(_category_bar_figure(names, values), use_container_width=True)
 
     def create_engagement_analysis(self):
         """Create engagement and viral spread analysis"""
@@ -242,27 +424,14 @@ class TelegramAnalysisDashboard:
             
             with col1:
                 # Views distribution
-                fig = px.histogram(
-                    self.df,
-                    x='Views',
-                    nbins=30,
-                    title="Distribution of Message Views",
-                    labels={'x': 'Views', 'y': 'Number of Messages'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_views_histogram_figure(self.df_fingerprint, self.df), use_container_width=True)
             
             with col2:
                 # Forwards vs Views scatter
-                fig = px.scatter(
-                    self.df,
-                    x='Views',
-                    y='Forwards',
-                    color='Intensity_Score',
-                    title="Views vs Forwards Relationship",
-                    labels={'x': 'Views', 'y': 'Forwards'},
-                    hover_data=['Categories']
+                st.plotly_chart(
+                    _engagement_scatter_figure(self.df_fingerprint, self.df),
+                    use_container_width=True
                 )
-                st.plotly_chart(fig, use_container_width=True)
         
         # Engagement metrics
         if self.summary_data and 'engagement_analysis' in self.summary_data:
@@ -300,43 +469,13 @@ class TelegramAnalysisDashboard:
         with col1:
             st.markdown("### Key Research Findings")
             st.markdown('<div class="insight-box">', unsafe_allow_html=True)
-            st.markdown("""
-            **1. Religious Opposition Dominance**
-            - 97% of coded content uses religious framing
-            - "Sin" appears 977 times as primary marker
-            - Leverages established authority structures
-            
-            **2. Sophisticated Messaging Strategy**  
-            - 99.9% content at Level 1 intensity (subtle)
-            - Designed to evade content moderation
-            - High viral potential (85.9% forwarded)
-            
-            **3. Coordinated Campaign Evidence**
-            - "Masculinity Saturday" recurring pattern
-            - 53% multimedia content strategy
-            - Targeted male demographic engagement
-            """)
+            st.markdown(_INSIGHTS_MD_LEFT)
             st.markdown('</div>', unsafe_allow_html=True)
         
         with col2:
             st.markdown("### Actionable Recommendations")
             st.markdown('<div class="warning-box">', unsafe_allow_html=True)
-            st.markdown("""
-            **Immediate Actions:**
-            - Implement Level 1 intensity detection systems
-            - Engage progressive faith leaders for counter-messaging
-            - Develop compelling visual counter-narratives
-            
-            **Medium-Term Strategies:**
-            - Platform algorithm transparency advocacy
-            - Longitudinal content evolution tracking
-            - Cross-platform analysis expansion
-            
-            **Long-Term Goals:**
-            - Address underlying socioeconomic factors
-            - Critical media literacy education integration
-            - Evidence-based platform regulation development
-            """)
+            st.markdown(_INSIGHTS_MD_RIGHT)
             st.markdown('</div>', unsafe_allow_html=True)
 
     def show_upload_interface(self):
@@ -364,25 +503,32 @@ class TelegramAnalysisDashboard:
                 help="Upload your analysis_summary.json file"
             )
         
+        # Loading happens in the button callbacks, which run before the script
+        # reruns, so that same rerun already finds the data in session_state
         if csv_file and json_file:
-            if st.button("Load Analysis Data"):
-                with st.spinner("Loading your analysis results..."):
-                    if self.load_data_from_files(csv_file, json_file):
-                        st.success("✅ Analysis data loaded successfully!")
-                        st.experimental_rerun()
+            st.button("Load Analysis Data", on_click=self._load_uploaded_files, args=(csv_file, json_file))
         
         st.markdown("---")
         st.markdown("### 🔬 Demo Mode")
         st.markdown("Want to see how the dashboard works? Try the demo with sample data:")
         
-        if st.button("Load Demo Data"):
-            with st.spinner("Loading demo data..."):
-                if self.load_sample_data():
-                    st.success("✅ Demo data loaded! Explore the analysis features.")
-                    st.experimental_rerun()
+        st.button("Load Demo Data", on_click=self._load_demo_data)
+
+    def _load_uploaded_files(self, csv_file, json_file):
+        """Button callback that loads the uploaded results behind a spinner"""
+        with st.spinner("Loading your analysis results..."):
+            if self.load_data_from_files(csv_file, json_file):
+                st.session_state['load_message'] = "✅ Analysis data loaded successfully!"
+
+    def _load_demo_data(self):
+        """Button callback that loads the demo data behind a spinner"""
+        with st.spinner("Loading demo data..."):
+            if self.load_sample_data():
+                st.session_state['load_message'] = "✅ Demo data loaded! Explore the analysis features."
 
     def run_dashboard(self):
         """Main dashboard runner"""
+        _inject_css()
         st.sidebar.title("📊 Navigation")
         
         # Check if data is loaded
@@ -390,6 +536,11 @@ class TelegramAnalysisDashboard:
             self.show_upload_interface()
             return
         
+        # Confirm a load from the button callback once, on the rerun it triggered
+        load_message = st.session_state.pop('load_message', None)
+        if load_message:
+            st.success(load_message)
+        
         # Show data info in sidebar
         st.sidebar.success("✅ Analysis data loaded")
         if self.summary_data:
@@ -420,9 +571,7 @@ class TelegramAnalysisDashboard:
         # Sidebar info
         st.sidebar.markdown("---")
         st.sidebar.markdown("### 🔄 Reset")
-        if st.sidebar.button("Upload New Data"):
-            st.session_state.clear()
-            st.experimental_rerun()
+        st.sidebar.button("Upload New Data", on_click=st.session_state.clear)
         
         st.sidebar.markdown("---")
         st.sidebar.markdown("### About")
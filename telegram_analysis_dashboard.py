@@ -9,15 +9,22 @@ Date: August 2025
 """
 
 import streamlit as st
+from streamlit.runtime.uploaded_file_manager import UploadedFile
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import json
 import os
 import numpy as np
 from datetime import datetime, timedelta
 import re
+import heapq
+from operator import itemgetter
+
+# Prefer orjson for parsing the summary file when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Page configuration
 st.set_page_config(
@@ -64,17 +71,329 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Repeated labels are stored as categoricals and the counts are
+# downcast to the narrowest integer type that holds their values
+_CSV_DTYPES = {
+    'Categories': 'category',
+    'Subcategories': 'category'
+}
+_INTEGER_COLUMNS = ('Views', 'Forwards', 'Intensity_Score')
+
+# Key cached loads on the upload's id instead of hashing its full contents
+_UPLOAD_HASH_FUNCS = {UploadedFile: lambda uploaded_file: uploaded_file.file_id}
+
+@st.cache_data(show_spinner=False, max_entries=4, hash_funcs=_UPLOAD_HASH_FUNCS)
+def _load_files(csv_source, json_source, source_mtimes=None):
+    """Parse the results CSV and summary JSON once per distinct input and
+    derive the aggregates the pages plot and filter by, plus the frame's
+    fingerprint that keys the per-page caches.
+
+    Sources are file paths or Streamlit uploads, which are read in place as
+    file objects; source_mtimes only keys the cache so re-generated result
+    files on disk are picked up.
+    """
+    df = pd.read_csv(csv_source, dtype=_CSV_DTYPES)
+    for column in _INTEGER_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], downcast='integer')
+    if 'Date' in df.columns:
+        # Parse dates once here rather than on every Temporal page visit
+        df['Date'] = pd.to_datetime(df['Date'], format='ISO8601', errors='coerce', cache=True)
+        df['Date_Only'] = df['Date'].dt.date
+    if isinstance(json_source, UploadedFile):
+        summary_data = _json_loads(json_source.read())
+    else:
+        with open(json_source, 'rb') as f:
+            summary_data = _json_loads(f.read())
+    return df, summary_data, _prepare_aggregates(df, summary_data), _df_fingerprint(df)
+
+# Scatter plots with more rows than this are downsampled before plotting
+_SCATTER_POINT_LIMIT = 4000
+
+def _m4_downsample(df, x, y, width=1000):
+    """Reduce a scatter to the M4 points (min/max of x and y) of each pixel column"""
+    # Rows missing either coordinate are never drawn, and an all-NaN pixel
+    # column would make idxmin/idxmax raise
+    df = df.dropna(subset=[x, y])
+    if df.empty:
+        return df
+    x_values = df[x].to_numpy(dtype=np.float64)
+    edges = np.linspace(np.nanmin(x_values), np.nanmax(x_values), width + 1)
+    pixel_columns = pd.Series(np.digitize(x_values, edges[1:-1]), index=df.index)
+    
+    grouped = df.groupby(pixel_columns)
+    keep = pd.concat([
+        grouped[x].idxmin(), grouped[x].idxmax(),
+        grouped[y].idxmin(), grouped[y].idxmax()
+    ]).unique()
+    return df.loc[np.sort(keep)]
+
+def _df_fingerprint(df):
+    """Cheap cache key for a DataFrame: row count plus a vectorized content hash"""
+    return len(df), int(pd.util.hash_pandas_object(df, index=False).sum())
+
+# Figure builders are cached on hashable (names, values) tuples and return
+# plain figure dicts, so revisiting a page does not rebuild its charts.
+# DataFrame arguments are prefixed with _ so Streamlit keys on the fingerprint.
+@st.cache_data(show_spinner=False, max_entries=16)
+def _category_pie_figure(names, values):
+    """Build the category distribution pie chart"""
+    import plotly.graph_objects as go
+    from plotly.colors import qualitative
+    fig_pie = go.Figure(
+        data=[go.Pie(
+            values=values,
+            labels=names,
+            textposition='inside',
+            textinfo='percent+label'
+        )],
+        layout=dict(
+            title="Distribution of Anti-Gender Content Categories",
+            piecolorway=qualitative.Set3
+        )
+    )
+    return fig_pie.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _category_bar_figure(names, values):
+    """Build the message count by category bar chart"""
+    import plotly.graph_objects as go
+    fig_bar = go.Figure(
+        data=[go.Bar(
+            x=names,
+            y=values,
+            marker=dict(color=values, colorscale='Viridis', showscale=True)
+        )],
+        layout=dict(
+            title="Message Count by Category",
+            xaxis=dict(title="Category", tickangle=-45),
+            yaxis_title="Number of Messages"
+        )
+    )
+    return fig_bar.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _subcategory_bar_figure(names, values):
+    """Build the top subcategories horizontal bar chart"""
+    import plotly.graph_objects as go
+    fig = go.Figure(
+        data=[go.Bar(
+            x=values,
+            y=names,
+            orientation='h',
+            marker=dict(color=values, colorscale='Plasma', showscale=True)
+        )],
+        layout=dict(
+            title="Top 10 Subcategories by Message Count",
+            xaxis_title="Number of Messages",
+            yaxis_title="Subcategory",
+            height=500
+        )
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _intensity_bar_figure(levels, counts):
+    """Build the message intensity distribution bar chart"""
+    import plotly.graph_objects as go
+    fig = go.Figure(
+        data=[go.Bar(
+            x=levels,
+            y=counts,
+            marker=dict(color=counts, colorscale='Reds', showscale=True)
+        )],
+        layout=dict(
+            title="Message Intensity Distribution",
+            xaxis_title="Intensity Level",
+            yaxis_title="Number of Messages"
+        )
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _markers_bar_figure(names, values):
+    """Build the top linguistic markers horizontal bar chart"""
+    import plotly.graph_objects as go
+    fig = go.Figure(
+        data=[go.Bar(
+            x=values,
+            y=names,
+            orientation='h',
+            marker=dict(color=values, colorscale='Viridis', showscale=True)
+        )],
+        layout=dict(
+            title="Top 15 Linguistic Markers",
+            xaxis_title="Occurrences",
+            yaxis_title="Linguistic Marker",
+            height=500
+        )
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _media_pie_figure(media_count, text_only_count):
+    """Build the media vs text-only pie chart"""
+    import plotly.graph_objects as go
+    fig = go.Figure(
+        data=[go.Pie(
+            values=[media_count, text_only_count],
+            labels=['With Media', 'Text Only'],
+            marker=dict(colors=['#ff7f0e', '#1f77b4'])
+        )],
+        layout=dict(title="Media Content Distribution")
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _views_histogram_figure(df_fingerprint, _df):
+    """Build the views histogram, binned here so only the bar heights are sent"""
+    import plotly.graph_objects as go
+    counts, edges = np.histogram(_df['Views'].dropna().to_numpy(), bins=30)
+    fig = go.Figure(
+        data=[go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges))],
+        layout=dict(
+            title="Distribution of Message Views",
+            xaxis_title="Views",
+            yaxis_title="Number of Messages",
+            bargap=0
+        )
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _engagement_scatter_figure(df_fingerprint, _df):
+    """Build the views vs forwards scatter, reduced to the points that shape it on screen"""
+    import plotly.graph_objects as go
+    scatter_df = _df
+    if len(scatter_df) > _SCATTER_POINT_LIMIT:
+        scatter_df = _m4_downsample(scatter_df, 'Views', 'Forwards')
+    fig = go.Figure(
+        data=[go.Scattergl(
+            x=scatter_df['Views'].to_numpy(),
+            y=scatter_df['Forwards'].to_numpy(),
+            mode='markers',
+            marker=dict(
+                color=scatter_df['Intensity_Score'].to_numpy(),
+                colorscale='Viridis',
+                showscale=True,
+                colorbar=dict(title='Intensity_Score')
+            ),
+            customdata=scatter_df['Categories'].to_numpy(),
+            hovertemplate="Views=%{x}<br>Forwards=%{y}<br>Categories=%{customdata}<extra></extra>"
+        )],
+        layout=dict(
+            title="Views vs Forwards Relationship",
+            xaxis_title="Views",
+            yaxis_title="Forwards"
+        )
+    )
+    return fig.to_dict()
+
+# Temporal aggregates are cached on the frame's fingerprint like the figures
+@st.cache_data(show_spinner=False, max_entries=4)
+def _daily_counts(df_fingerprint, _df):
+    """Count messages per day"""
+    return _df.groupby('Date_Only').size().reset_index(name='Message_Count')
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _daily_category_counts(df_fingerprint, _df):
+    """Count messages per day and category, zero on days a category is absent"""
+    # Expand categories and create daily category counts
+    cat_df = _df.loc[_df['Categories'].notna(), ['Date_Only', 'Categories']]
+    cat_df = cat_df.assign(Category=cat_df['Categories'].str.split('; ')).explode('Category')
+    cat_df['Category'] = cat_df['Category'].str.strip()
+    cat_df = cat_df[cat_df['Category'] != '']
+    if cat_df.empty:
+        return pd.DataFrame()
+    return cat_df.groupby(['Date_Only', 'Category']).size().unstack(fill_value=0)
+
+# Linguistic marker groups summarised on the Linguistics page
+_MARKER_GROUPS = {
+    'religious': ('sin', 'immoral', 'abomination'),
+    'masculinity': ('beta male', 'emasculation', 'real men'),
+    'cultural': ('imported', 'our culture', 'traditional values')
+}
+
+def _engagement_stats(views, forwards):
+    """Average views, average forwards and max views of the loaded messages"""
+    if not views.size:
+        return None
+    return {
+        'average_views': float(np.nanmean(views)),
+        'average_forwards': float(np.nanmean(forwards)),
+        'max_views': int(np.nanmax(views))
+    }
+
+def _split_pairs(pairs):
+    """Split (label, count) pairs into parallel label and count tuples"""
+    return tuple(label for label, _ in pairs), tuple(count for _, count in pairs)
+
+def _prepare_aggregates(df, summary_data):
+    """Derive the chart tuples and explorer lookups from a freshly loaded dataset"""
+    # Label/count tuples the summary charts plot
+    category_items = _split_pairs(summary_data.get('category_distribution', {}).items())
+    intensity_sorted = _split_pairs(sorted(
+        summary_data.get('intensity_distribution', {}).items(), key=lambda kv: int(kv[0])
+    ))
+    top_subcats = _split_pairs(heapq.nlargest(
+        10, summary_data.get('subcategory_distribution', {}).items(), key=itemgetter(1)
+    ))
+    top_markers = _split_pairs(heapq.nlargest(
+        15, summary_data.get('top_linguistic_markers', {}).items(), key=itemgetter(1)
+    ))
+    markers = summary_data.get('top_linguistic_markers', {})
+    marker_totals = {
+        group: sum(markers.get(m, 0) for m in group_markers)
+        for group, group_markers in _MARKER_GROUPS.items()
+    }
+    engagement = _engagement_stats(
+        df['Views'].to_numpy(dtype=np.float64), df['Forwards'].to_numpy(dtype=np.float64)
+    )
+    
+    # Message x category boolean matrix for the explorer filter. Only the
+    # distinct "A; B" labels are split; rows pick theirs up through the
+    # category codes, and missing labels (code -1) select the trailing
+    # all-False row. Stored column-major so each category is contiguous.
+    categories = df['Categories'].astype('category')
+    tokens = pd.Series(categories.cat.categories).str.split('; ').explode().str.strip()
+    tokens = tokens[tokens != '']
+    unique_categories = sorted(tokens.unique())
+    cat_lookup = {cat: col for col, cat in enumerate(unique_categories)}
+    label_matrix = np.zeros((len(categories.cat.categories) + 1, len(unique_categories)), dtype=bool)
+    label_matrix[tokens.index.to_numpy(), tokens.map(cat_lookup).to_numpy()] = True
+    cat_matrix = np.asfortranarray(label_matrix[categories.cat.codes.to_numpy()])
+    unique_categories = ['All'] + unique_categories
+    intensity_levels = ['All'] + sorted(df['Intensity_Score'].dropna().unique().tolist())
+    
+    return {
+        'category_items': category_items,
+        'intensity_sorted': intensity_sorted,
+        'top_subcats': top_subcats,
+        'top_markers': top_markers,
+        'marker_totals': marker_totals,
+        'cat_lookup': cat_lookup,
+        'cat_matrix': cat_matrix,
+        'unique_categories': unique_categories,
+        'engagement': engagement,
+        'intensity_levels': intensity_levels
+    }
+
 class TelegramAnalysisDashboard:
     def __init__(self):
         self.df = None
         self.summary_data = None
+        self.aggregates = {}
+        self.df_fingerprint = None
         
     def load_data(self, csv_path, json_path):
         """Load analysis data from CSV and JSON files"""
         try:
-            self.df = pd.read_csv(csv_path)
-            with open(json_path, 'r') as f:
-                self.summary_data = json.load(f)
+            source_mtimes = None
+            if not isinstance(csv_path, UploadedFile):
+                source_mtimes = (os.path.getmtime(csv_path), os.path.getmtime(json_path))
+            self.df, self.summary_data, self.aggregates, self.df_fingerprint = _load_files(
+                csv_path, json_path, source_mtimes
+            )
             return True
         except Exception as e:
             st.error(f"Error loading data: {str(e)}")
@@ -124,33 +443,23 @@ class TelegramAnalysisDashboard:
         st.markdown('<div class="category-header">📈 Content Category Analysis</div>', unsafe_allow_html=True)
         
         if self.summary_data and 'category_distribution' in self.summary_data:
-            categories = self.summary_data['category_distribution']
+            names, values = self.aggregates['category_items']
             
             col1, col2 = st.columns(2)
             
             with col1:
                 # Pie chart for category distribution
-                fig_pie = px.pie(
-                    values=list(categories.values()),
-                    names=list(categories.keys()),
-                    title="Distribution of Anti-Gender Content Categories",
-                    color_discrete_sequence=px.colors.qualitative.Set3
+                st.plotly_chart(
+                    _category_pie_figure(names, values),
+                    use_container_width=True
                 )
-                fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-                st.plotly_chart(fig_pie, use_container_width=True)
             
             with col2:
                 # Bar chart for category counts
-                fig_bar = px.bar(
-                    x=list(categories.keys()),
-                    y=list(categories.values()),
-                    title="Message Count by Category",
-                    labels={'x': 'Category', 'y': 'Number of Messages'},
-                    color=list(categories.values()),
-                    color_continuous_scale='viridis'
+                st.plotly_chart(
+                    _category_bar_figure(names, values),
+                    use_container_width=True
                 )
-                fig_bar.update_layout(xaxis_tickangle=-45)
-                st.plotly_chart(fig_bar, use_container_width=True)
 
     def create_subcategory_analysis(self):
         """Create subcategory analysis visualization"""
@@ -160,19 +469,12 @@ class TelegramAnalysisDashboard:
             subcats = self.summary_data['subcategory_distribution']
             
             # Top 10 subcategories
-            top_subcats = dict(list(subcats.items())[:10])
-            
-            fig = px.bar(
-                x=list(top_subcats.values()),
-                y=list(top_subcats.keys()),
-                orientation='h',
-                title="Top 10 Subcategories by Message Count",
-                labels={'x': 'Number of Messages', 'y': 'Subcategory'},
-                color=list(top_subcats.values()),
-                color_continuous_scale='plasma'
+            names, values = self.aggregates['top_subcats']
+            
+            st.plotly_chart(
+                _subcategory_bar_figure(names, values),
+                use_container_width=True
             )
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
             
             # Subcategory insights
             st.markdown('<div class="insight-box">', unsafe_allow_html=True)
@@ -193,18 +495,10 @@ class TelegramAnalysisDashboard:
             
             with col1:
                 # Intensity distribution
-                levels = [f"Level {k}" for k in sorted(intensity.keys())]
-                counts = [intensity[k] for k in sorted(intensity.keys())]
+                keys, counts = self.aggregates['intensity_sorted']
+                levels = tuple(f"Level {k}" for k in keys)
                 
-                fig = px.bar(
-                    x=levels,
-                    y=counts,
-                    title="Message Intensity Distribution",
-                    labels={'x': 'Intensity Level', 'y': 'Number of Messages'},
-                    color=counts,
-                    color_continuous_scale='reds'
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_intensity_bar_figure(levels, counts), use_container_width=True)
             
             with col2:
                 # Intensity explanation
@@ -225,36 +519,24 @@ class TelegramAnalysisDashboard:
         st.markdown('<div class="category-header">🚀 Engagement & Viral Spread Analysis</div>', unsafe_allow_html=True)
         
         if self.df is not None:
+            fingerprint = self.df_fingerprint
             col1, col2 = st.columns(2)
             
             with col1:
                 # Views distribution
-                fig = px.histogram(
-                    self.df,
-                    x='Views',
-                    nbins=30,
-                    title="Distribution of Message Views",
-                    labels={'x': 'Views', 'y': 'Number of Messages'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_views_histogram_figure(fingerprint, self.df), use_container_width=True)
             
             with col2:
                 # Forwards vs Views scatter
-                fig = px.scatter(
-                    self.df,
-                    x='Views',
-                    y='Forwards',
-                    color='Intensity_Score',
-                    title="Views vs Forwards Relationship",
-                    labels={'x': 'Views', 'y': 'Forwards'},
-                    hover_data=['Categories']
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_engagement_scatter_figure(fingerprint, self.df), use_container_width=True)
         
-        # Engagement metrics
-        if self.summary_data and 'engagement_analysis' in self.summary_data:
-            engagement = self.summary_data['engagement_analysis']
-            
+        # Engagement metrics, computed from the loaded messages; the summary
+        # JSON figures are only used when the CSV has no rows
+        engagement = self.aggregates.get('engagement')
+        if engagement is None and self.summary_data:
+            engagement = self.summary_data.get('engagement_analysis')
+        
+        if engagement:
             col1, col2, col3 = st.columns(3)
             
             with col1:
@@ -289,31 +571,20 @@ class TelegramAnalysisDashboard:
             
             with col1:
                 # Top markers bar chart
-                top_markers = dict(list(markers.items())[:15])
+                names, values = self.aggregates['top_markers']
                 
-                fig = px.bar(
-                    x=list(top_markers.values()),
-                    y=list(top_markers.keys()),
-                    orientation='h',
-                    title="Top 15 Linguistic Markers",
-                    labels={'x': 'Occurrences', 'y': 'Linguistic Marker'},
-                    color=list(top_markers.values()),
-                    color_continuous_scale='viridis'
+                st.plotly_chart(
+                    _markers_bar_figure(names, values),
+                    use_container_width=True
                 )
-                fig.update_layout(height=500)
-                st.plotly_chart(fig, use_container_width=True)
             
             with col2:
                 # Marker insights
                 st.markdown("**Key Linguistic Patterns:**")
                 
-                religious_markers = ['sin', 'immoral', 'abomination']
-                masculinity_markers = ['beta male', 'emasculation', 'real men']
-                cultural_markers = ['imported', 'our culture', 'traditional values']
-                
-                religious_count = sum(markers.get(m, 0) for m in religious_markers)
-                masculinity_count = sum(markers.get(m, 0) for m in masculinity_markers)
-                cultural_count = sum(markers.get(m, 0) for m in cultural_markers)
+                religious_count = self.aggregates['marker_totals']['religious']
+                masculinity_count = self.aggregates['marker_totals']['masculinity']
+                cultural_count = self.aggregates['marker_totals']['cultural']
                 
                 st.markdown(f"**Religious Opposition:** {religious_count} total occurrences")
                 st.markdown(f"- 'sin': {markers.get('sin', 0)} times")
@@ -340,13 +611,10 @@ class TelegramAnalysisDashboard:
             
             with col1:
                 # Media vs non-media distribution
-                fig = px.pie(
-                    values=[media_count, total_relevant - media_count],
-                    names=['With Media', 'Text Only'],
-                    title="Media Content Distribution",
-                    color_discrete_sequence=['#ff7f0e', '#1f77b4']
+                st.plotly_chart(
+                    _media_pie_figure(media_count, total_relevant - media_count),
+                    use_container_width=True
                 )
-                st.plotly_chart(fig, use_container_width=True)
             
             with col2:
                 st.metric(
@@ -368,51 +636,57 @@ class TelegramAnalysisDashboard:
 
     def create_temporal_analysis(self):
         """Create temporal patterns analysis"""
+        import plotly.graph_objects as go
+        
         st.markdown('<div class="category-header">📅 Temporal Patterns</div>', unsafe_allow_html=True)
         
         if self.df is not None and 'Date' in self.df.columns:
-            # Convert date column
-            self.df['Date'] = pd.to_datetime(self.df['Date'])
-            self.df['Date_Only'] = self.df['Date'].dt.date
+            fingerprint = self.df_fingerprint
             
             # Daily message counts
-            daily_counts = self.df.groupby('Date_Only').size().reset_index(name='Message_Count')
-            
-            fig = px.line(
-                daily_counts,
-                x='Date_Only',
-                y='Message_Count',
-                title="Daily Anti-Gender Message Volume",
-                labels={'Date_Only': 'Date', 'Message_Count': 'Number of Messages'}
+            daily_counts = _daily_counts(fingerprint, self.df)
+            
+            # Drawn with WebGL so long date ranges don't build one SVG path per point
+            fig = go.Figure(
+                data=[go.Scattergl(
+                    x=daily_counts['Date_Only'],
+                    y=daily_counts['Message_Count'].to_numpy(),
+                    mode='lines'
+                )],
+                layout=dict(
+                    title="Daily Anti-Gender Message Volume",
+                    xaxis_title="Date",
+                    yaxis_title="Number of Messages"
+                )
             )
             st.plotly_chart(fig, use_container_width=True)
             
             # Category distribution over time
             if 'Categories' in self.df.columns:
-                # Expand categories and create daily category counts
-                category_data = []
-                for _, row in self.df.iterrows():
-                    categories = row['Categories'].split('; ') if row['Categories'] else []
-                    for cat in categories:
-                        category_data.append({
-                            'Date': row['Date_Only'],
-                            'Category': cat.strip()
-                        })
+                daily_cat_counts = _daily_category_counts(fingerprint, self.df)
                 
-                if category_data:
-                    cat_df = pd.DataFrame(category_data)
-                    daily_cat_counts = cat_df.groupby(['Date', 'Category']).size().reset_index(name='Count')
-                    
-                    fig = px.area(
-                        daily_cat_counts,
-                        x='Date',
-                        y='Count',
-                        color='Category',
-                        title="Category Distribution Over Time",
-                        labels={'Date': 'Date', 'Count': 'Number of Messages'}
+                if not daily_cat_counts.empty:
+                    fig = go.Figure(
+                        data=[
+                            go.Scatter(
+                                x=daily_cat_counts.index,
+                                y=daily_cat_counts[category].to_numpy(),
+                                name=category,
+                                mode='lines',
+                                stackgroup='one'
+                            )
+                            for category in daily_cat_counts.columns
+                        ],
+                        layout=dict(
+                            title="Category Distribution Over Time",
+                            xaxis_title="Date",
+                            yaxis_title="Number of Messages",
+                            legend_title="Category"
+                        )
                     )
                     st.plotly_chart(fig, use_container_width=True)
 
+    @st.fragment
     def create_message_explorer(self):
         """Create message explorer section"""
         st.markdown('<div class="category-header">🔎 Message Content Explorer</div>', unsafe_allow_html=True)
@@ -422,28 +696,27 @@ class TelegramAnalysisDashboard:
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                categories = ['All'] + list(set(cat.strip() for cats in self.df['Categories'].dropna() 
-                                               for cat in cats.split('; ')))
-                selected_category = st.selectbox("Filter by Category", categories)
+                selected_category = st.selectbox("Filter by Category", self.aggregates['unique_categories'])
             
             with col2:
-                intensity_levels = ['All'] + sorted(self.df['Intensity_Score'].unique())
-                selected_intensity = st.selectbox("Filter by Intensity", intensity_levels)
+                selected_intensity = st.selectbox("Filter by Intensity", self.aggregates['intensity_levels'])
             
             with col3:
                 min_views = st.number_input("Minimum Views", min_value=0, value=0)
             
-            # Filter dataframe
-            filtered_df = self.df.copy()
+            # Filter dataframe with a single combined mask
+            mask = np.ones(len(self.df), dtype=bool)
             
             if selected_category != 'All':
-                filtered_df = filtered_df[filtered_df['Categories'].str.contains(selected_category, na=False)]
+                mask &= self.aggregates['cat_matrix'][:, self.aggregates['cat_lookup'][selected_category]]
             
             if selected_intensity != 'All':
-                filtered_df = filtered_df[filtered_df['Intensity_Score'] == selected_intensity]
+                mask &= self.df['Intensity_Score'].to_numpy() == selected_intensity
             
             if min_views > 0:
-                filtered_df = filtered_df[filtered_df['Views'] >= min_views]
+                mask &= self.df['Views'].to_numpy() >= min_views
+            
+            filtered_df = self.df[mask]
             
             # Display results
             st.markdown(f"**Showing {len(filtered_df)} messages matching your criteria:**")
@@ -455,12 +728,12 @@ class TelegramAnalysisDashboard:
                     ['Message_ID', 'Text_Preview', 'Categories', 'Intensity_Score', 'Views', 'Forwards']
                 ]
                 
-                for _, row in sample_df.iterrows():
-                    with st.expander(f"Message {row['Message_ID']} - {row['Views']} views"):
-                        st.markdown(f"**Text Preview:** {row['Text_Preview']}")
-                        st.markdown(f"**Categories:** {row['Categories']}")
-                        st.markdown(f"**Intensity:** Level {row['Intensity_Score']}")
-                        st.markdown(f"**Engagement:** {row['Views']} views, {row['Forwards']} forwards")
+                for row in sample_df.itertuples(index=False):
+                    with st.expander(f"Message {row.Message_ID} - {row.Views} views"):
+                        st.markdown(f"**Text Preview:** {row.Text_Preview}")
+                        st.markdown(f"**Categories:** {row.Categories}")
+                        st.markdown(f"**Intensity:** Level {row.Intensity_Score}")
+                        st.markdown(f"**Engagement:** {row.Views} views, {row.Forwards} forwards")
 
     def create_research_insights(self):
         """Create research insights and recommendations"""
@@ -531,12 +804,8 @@ class TelegramAnalysisDashboard:
         # Load data
         data_loaded = False
         if csv_file and json_file:
-            # Save uploaded files temporarily
-            with open("temp_analysis.csv", "wb") as f:
-                f.write(csv_file.getvalue())
-            with open("temp_summary.json", "wb") as f:
-                f.write(json_file.getvalue())
-            data_loaded = self.load_data("temp_analysis.csv", "temp_summary.json")
+            # Uploads are parsed straight from Streamlit's in-memory buffers
+            data_loaded = self.load_data(csv_file, json_file)
         elif os.path.exists(default_csv) and os.path.exists(default_json):
             data_loaded = self.load_data(default_csv, default_json)
             st.sidebar.success("✅ Using default analysis results")
@@ -0,0 +1,46 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import streamlit_app
+import telegram_analysis_dashboard
+
+
+@pytest.fixture(params=[telegram_analysis_dashboard, streamlit_app], ids=['telegram', 'streamlit'])
+def m4_downsample(request):
+    return request.param._m4_downsample
+
+
+def _engagement_frame(n_rows=20_000):
+    views = np.arange(n_rows, dtype=np.float64)
+    return pd.DataFrame({'Views': views, 'Forwards': views % 37})
+
+
+def test_m4_downsample_keeps_column_extremes(m4_downsample):
+    df = _engagement_frame()
+    reduced = m4_downsample(df, 'Views', 'Forwards')
+
+    assert len(reduced) < len(df)
+    assert reduced['Views'].min() == df['Views'].min()
+    assert reduced['Views'].max() == df['Views'].max()
+    assert reduced['Forwards'].max() == df['Forwards'].max()
+
+
+def test_m4_downsample_skips_nan_forwards(m4_downsample):
+    df = _engagement_frame()
+    df.loc[df['Views'] > 9900, 'Forwards'] = np.nan
+    reduced = m4_downsample(df, 'Views', 'Forwards')
+
+    assert not reduced.empty
+    assert reduced['Forwards'].notna().all()
+    assert reduced['Views'].max() <= 9900
+
+
+def test_m4_downsample_all_nan(m4_downsample):
+    df = _engagement_frame().assign(Forwards=np.nan)
+    assert m4_downsample(df, 'Views', 'Forwards').empty